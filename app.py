@@ -7,31 +7,113 @@ This module can be executed directly or used via a WSGI server.  It relies on
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Any, Dict, Iterable, List
-
-from flask import Flask, jsonify, request
-from werkzeug.exceptions import HTTPException
+import functools
+import sys
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, MutableMapping, Tuple
+
+from cachetools import TTLCache
+from curl_cffi import requests as curl_requests
+from flask import Flask, Response, jsonify, request
+from flask_compress import Compress
+from flask.json.provider import DefaultJSONProvider
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator, model_validator
+import requests
+from werkzeug.exceptions import InternalServerError
 import yfinance as yf
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that delegates encoding and decoding to ``orjson``."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+# Keep unhandled errors on the JSON 500 handler even in debug and testing mode,
+# where Flask would otherwise re-raise them before any handler runs.
+app.config["PROPAGATE_EXCEPTIONS"] = False
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_ALGORITHM_STREAMING"] = ["br", "deflate"]
+app.config["COMPRESS_MIN_SIZE"] = 1024
+Compress(app)
+
+# Upstream responses are cached per symbol: live quotes only briefly, company
+# profiles for longer since they rarely change during the day.
+_QUOTE_CACHE: MutableMapping[Hashable, Any] = TTLCache(maxsize=4096, ttl=60)
+_PROFILE_CACHE: MutableMapping[Hashable, Any] = TTLCache(maxsize=4096, ttl=3600)
+_CACHE_LOCK = threading.Lock()
+
+# A single upstream session keeps connections (and Yahoo's cookie/crumb) warm
+# across requests instead of paying the TCP and TLS handshake every time.
+_SESSION = curl_requests.Session(impersonate="chrome")
+
+# Shared pool for fanning out upstream calls; yfinance requests are I/O bound so
+# threads overlap the network waits.
+_EXECUTOR = ThreadPoolExecutor(max_workers=16)
+
+# Upper bound on the symbols accepted by a single bulk request, so that one
+# client cannot monopolize the shared executor or burst requests at Yahoo.
+_MAX_BULK_SYMBOLS = 100
 
 
 class ClientError(ValueError):
     """Exception raised when the client provides invalid input."""
 
 
-@dataclass
-class HistoricalRequest:
+class HistoricalRequest(BaseModel):
     """Represents the payload for historical data queries."""
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     start_date: datetime
     end_date: datetime
     interval: str = "1d"
 
+    @field_validator("symbol")
+    @classmethod
+    def normalize_symbol(cls, value: str) -> str:
+        symbol = _normalize_symbol(value)
+        if not symbol:
+            raise ValueError("'symbol' cannot be empty")
+        return symbol
+
+    @field_validator("start_date", "end_date", mode="before")
+    @classmethod
+    def parse_date(cls, value: Any) -> datetime:
+        return _parse_date(value)
+
+    @field_validator("interval")
+    @classmethod
+    def default_interval(cls, value: str) -> str:
+        return value.strip() or "1d"
+
+    @model_validator(mode="after")
+    def check_date_range(self) -> "HistoricalRequest":
+        if self.start_date > self.end_date:
+            raise ValueError("'start_date' must not be after 'end_date'")
+        return self
+
     @classmethod
     def from_payload(cls, payload: Dict[str, Any]) -> "HistoricalRequest":
         """Validate and build an instance from a JSON payload.
@@ -44,32 +126,52 @@ class HistoricalRequest:
             raise ClientError("JSON body must be an object")
 
         try:
-            symbol = payload["symbol"].strip().upper()
-        except KeyError as exc:  # pragma: no cover - defensive programming
-            raise ClientError("'symbol' field is required") from exc
-        except AttributeError as exc:
-            raise ClientError("'symbol' must be a string") from exc
+            return cls.model_validate(payload)
+        except ValidationError as exc:
+            raise ClientError(cls._describe_error(exc.errors()[0])) from exc
 
-        if not symbol:
-            raise ClientError("'symbol' cannot be empty")
+    @classmethod
+    def _describe_error(cls, error: Dict[str, Any]) -> str:
+        """Translate the first pydantic error into the API's error message."""
+
+        field = error["loc"][0] if error["loc"] else None
+        if error["type"] == "missing":
+            return f"'{field}' field is required"
+        if error["type"] == "string_type":
+            suffix = "" if cls.model_fields[field].is_required() else " if provided"
+            return f"'{field}' must be a string{suffix}"
+        if error["type"] == "value_error":
+            return str(error["ctx"]["error"])
+        return error["msg"]
+
+
+def _parse_symbols(payload: Any) -> List[str]:
+    """Validate a bulk payload and return its unique, upper-cased symbols."""
+
+    if not isinstance(payload, dict):
+        raise ClientError("JSON body must be an object")
 
-        if "start_date" not in payload:
-            raise ClientError("'start_date' field is required")
-        start_date = _parse_date(payload.get("start_date"))
+    symbols = payload.get("symbols")
+    if not isinstance(symbols, list) or not symbols:
+        raise ClientError("'symbols' must be a non-empty list")
+    if len(symbols) > _MAX_BULK_SYMBOLS:
+        raise ClientError(f"'symbols' may contain at most {_MAX_BULK_SYMBOLS} entries")
 
-        if "end_date" not in payload:
-            raise ClientError("'end_date' field is required")
-        end_date = _parse_date(payload.get("end_date"))
+    normalized: List[str] = []
+    for symbol in symbols:
+        if isinstance(symbol, str):
+            symbol = _normalize_symbol(symbol)
+        if not isinstance(symbol, str) or not symbol:
+            raise ClientError("'symbols' must only contain non-empty strings")
+        normalized.append(symbol)
+    return list(dict.fromkeys(normalized))
 
-        if start_date > end_date:
-            raise ClientError("'start_date' must not be after 'end_date'")
 
-        interval = payload.get("interval", "1d")
-        if not isinstance(interval, str):
-            raise ClientError("'interval' must be a string if provided")
-        interval = interval.strip() or "1d"
+@functools.lru_cache(maxsize=8192)
+def _normalize_symbol(symbol: str) -> str:
+    """Return the stripped, upper-cased and interned form of a ticker symbol."""
 
-        return cls(symbol=symbol, start_date=start_date, end_date=end_date, interval=interval)
+    return sys.intern(symbol.strip().upper())
 
 
 def _parse_date(value: Any) -> datetime:
@@ -78,8 +180,14 @@ def _parse_date(value: Any) -> datetime:
     if not isinstance(value, str):
         raise ClientError("Dates must be provided as YYYY-MM-DD strings")
 
+    # The format is fixed, so slice the fields directly rather than going
+    # through ``strptime`` and its format-string machinery.
+    digits = value[0:4] + value[5:7] + value[8:10]
+    if len(value) != 10 or value[4] != "-" or value[7] != "-" or not (digits.isascii() and digits.isdigit()):
+        raise ClientError("Dates must follow the YYYY-MM-DD format")
+
     try:
-        return datetime.strptime(value, "%Y-%m-%d")
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
     except ValueError as exc:
         raise ClientError("Dates must follow the YYYY-MM-DD format") from exc
 
@@ -92,14 +200,24 @@ def _handle_client_error(exc: ClientError):
     return jsonify(response), 400
 
 
-@app.errorhandler(Exception)
-def _handle_uncaught_error(exc: Exception):
-    """Return a JSON response for unexpected server errors."""
+@app.errorhandler(requests.exceptions.RequestException)
+@app.errorhandler(curl_requests.exceptions.RequestException)
+def _handle_upstream_error(exc: Exception):
+    """Return a JSON response when an upstream request escapes ``_safe_fetch``."""
+
+    return _upstream_error_response()
 
-    if isinstance(exc, HTTPException):  # pragma: no cover - rely on Werkzeug's handler
-        return exc
 
-    response = {"error": "An unexpected error occurred", "details": str(exc)}
+@app.errorhandler(InternalServerError)
+def _handle_internal_error(exc: InternalServerError):
+    """Return a JSON response for unexpected server errors.
+
+    Flask routes unhandled exceptions here wrapped in ``InternalServerError``,
+    while other HTTP errors keep Werkzeug's default handling.
+    """
+
+    original = exc.original_exception or exc
+    response = {"error": "An unexpected error occurred", "details": str(original)}
     return jsonify(response), 500
 
 
@@ -107,15 +225,16 @@ def _handle_uncaught_error(exc: Exception):
 def company_information(symbol: str):
     """Return company profile information using Yahoo Finance data."""
 
-    data = _safe_fetch(lambda: yf.Ticker(symbol).info)
+    symbol = _normalize_symbol(symbol)
+    data = _cached_fetch(_PROFILE_CACHE, ("info", symbol), lambda: yf.Ticker(symbol, session=_SESSION).info)
     if data is None:
         return _upstream_error_response()
 
     if not data:
-        raise ClientError(f"No company information found for symbol '{symbol.upper()}'")
+        raise ClientError(f"No company information found for symbol '{symbol}'")
 
     payload = {
-        "symbol": symbol.upper(),
+        "symbol": symbol,
         "name": data.get("longName") or data.get("shortName"),
         "summary": data.get("longBusinessSummary"),
         "industry": data.get("industry"),
@@ -130,28 +249,78 @@ def company_information(symbol: str):
 def stock_market_data(symbol: str):
     """Return real-time market data for the specified symbol."""
 
-    ticker = yf.Ticker(symbol)
-    fast_info = _safe_fetch(lambda: ticker.fast_info)
-    if fast_info is None:
+    symbol = _normalize_symbol(symbol)
+    quote = _cached_fetch(_QUOTE_CACHE, ("fast_info", symbol), lambda: _fetch_quote(symbol))
+    if quote is None:
         return _upstream_error_response()
 
-    if not fast_info:
-        raise ClientError(f"No market data found for symbol '{symbol.upper()}'")
+    if not quote:
+        raise ClientError(f"No market data found for symbol '{symbol}'")
 
-    payload = {
-        "symbol": symbol.upper(),
-        "currency": fast_info.get("currency"),
-        "last_price": fast_info.get("last_price"),
-        "previous_close": fast_info.get("previous_close"),
-        "open": fast_info.get("open"),
-        "day_high": fast_info.get("day_high"),
-        "day_low": fast_info.get("day_low"),
-        "volume": fast_info.get("volume"),
-        "market_cap": fast_info.get("market_cap"),
-        "fifty_two_week_high": fast_info.get("year_high"),
-        "fifty_two_week_low": fast_info.get("year_low"),
+    return jsonify({"symbol": symbol, **quote})
+
+
+@app.post("/api/bulk-stock-data")
+def bulk_stock_market_data():
+    """Return real-time market data for several symbols in a single request."""
+
+    payload = request.get_json(silent=True)
+    symbols = _parse_symbols(payload)
+
+    futures = {
+        _EXECUTOR.submit(
+            _cached_fetch, _QUOTE_CACHE, ("fast_info", symbol), lambda symbol=symbol: _fetch_quote(symbol)
+        ): symbol
+        for symbol in symbols
+    }
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for future in as_completed(futures):
+        symbol = futures[future]
+        quote = future.result()
+        if quote is None:
+            errors[symbol] = "Failed to retrieve data from upstream provider"
+        elif not quote:
+            errors[symbol] = f"No market data found for symbol '{symbol}'"
+        else:
+            results[symbol] = {"symbol": symbol, **quote}
+
+    return jsonify({"results": results, "errors": errors})
+
+
+@app.post("/api/bulk-quotes")
+def bulk_quotes():
+    """Return intraday closing prices for many symbols using Yahoo's spark API.
+
+    Symbols are packed into batches of up to 20, the most Yahoo accepts per
+    spark query, so a watchlist needs one upstream request per batch instead
+    of one per symbol.  The shared ``_MAX_BULK_SYMBOLS`` cap bounds the number
+    of batches a single request can queue on the executor.
+    """
+
+    payload = request.get_json(silent=True)
+    symbols = _parse_symbols(payload)
+
+    futures = {
+        _EXECUTOR.submit(_safe_fetch, lambda batch=batch: _fetch_spark(batch)): batch
+        for batch in _chunked(symbols, _SPARK_BATCH_SIZE)
     }
-    return jsonify(payload)
+
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for future in as_completed(futures):
+        batch = futures[future]
+        quotes = future.result()
+        for symbol in batch:
+            if quotes is None:
+                errors[symbol] = "Failed to retrieve data from upstream provider"
+            elif symbol not in quotes:
+                errors[symbol] = f"No market data found for symbol '{symbol}'"
+            else:
+                results[symbol] = {"symbol": symbol, **quotes[symbol]}
+
+    return jsonify({"results": results, "errors": errors})
 
 
 @app.post("/api/historical-data")
@@ -168,29 +337,22 @@ def historical_market_data():
             end=historical_request.end_date + timedelta(days=1),
             interval=historical_request.interval,
             auto_adjust=False,
+            actions=False,
+            rounding=False,
+            threads=False,
             progress=False,
+            multi_level_index=False,
+            session=_SESSION,
         )
     )
     if data is None:
         return _upstream_error_response()
 
-    if data.empty:
+    if len(data.index) == 0:
         raise ClientError("No historical data found for the specified parameters")
 
-    results = [
-        {
-            "date": index.strftime("%Y-%m-%d"),
-            "open": float(row.Open),
-            "high": float(row.High),
-            "low": float(row.Low),
-            "close": float(row.Close),
-            "adj_close": float(row["Adj Close"]),
-            "volume": int(row.Volume),
-        }
-        for index, row in data.iterrows()
-    ]
-
-    return jsonify({"symbol": historical_request.symbol, "interval": historical_request.interval, "data": results})
+    body = _stream_historical(historical_request.symbol, historical_request.interval, _iter_candles(data))
+    return Response(body, mimetype="application/json")
 
 
 @app.post("/api/analytical-insights")
@@ -207,36 +369,229 @@ def analytical_insights():
             end=historical_request.end_date + timedelta(days=1),
             interval=historical_request.interval,
             auto_adjust=True,
+            actions=False,
+            rounding=False,
+            threads=False,
+            group_by="column",
             progress=False,
+            multi_level_index=False,
+            session=_SESSION,
         )
     )
     if data is None:
         return _upstream_error_response()
 
-    if data.empty:
+    if len(data.index) == 0:
         raise ClientError("No analytical data found for the specified parameters")
 
-    closing_prices = data["Close"]
+    # Only the closing prices feed the analytics.  Materialize them once as a
+    # contiguous float64 buffer so the fused reducer streams through memory in
+    # order (and numba compiles a C-layout kernel).
+    closing_prices = np.ascontiguousarray(data["Close"].dropna().to_numpy(dtype=np.float64))
+    average, highest, lowest, volatility, total_return = _close_stats(closing_prices)
     insights = {
         "symbol": historical_request.symbol,
         "interval": historical_request.interval,
         "start_date": historical_request.start_date.strftime("%Y-%m-%d"),
         "end_date": historical_request.end_date.strftime("%Y-%m-%d"),
-        "average_close": float(closing_prices.mean()),
-        "highest_close": float(closing_prices.max()),
-        "lowest_close": float(closing_prices.min()),
-        "closing_price_volatility": float(closing_prices.std()),
-        "total_return": float(_compute_total_return(closing_prices)),
+        "average_close": float(average),
+        "highest_close": float(highest),
+        "lowest_close": float(lowest),
+        "closing_price_volatility": float(volatility),
+        "total_return": float(total_return),
     }
     return jsonify(insights)
 
 
-def _compute_total_return(series):
-    """Compute the total return for a series of closing prices."""
+_CANDLE_KEYS = ("date", "open", "high", "low", "close", "adj_close", "volume")
+
+# yfinance column and dtype for each candle field after "date", in key order.
+_CANDLE_COLUMNS = (
+    ("Open", "float64"),
+    ("High", "float64"),
+    ("Low", "float64"),
+    ("Close", "float64"),
+    ("Adj Close", "float64"),
+    ("Volume", "int64"),
+)
+
+
+def _iter_candles(data) -> Iterator[Dict[str, Any]]:
+    """Yield JSON-ready candles from a yfinance OHLCV frame.
+
+    The needed columns are selected once in a fixed order and extracted as
+    NumPy arrays rather than walking the frame row by row, so every candle is
+    built from plain tuples with no per-row attribute lookups.
+    """
+
+    frame = data[[name for name, _ in _CANDLE_COLUMNS]]
+    columns = [_format_dates(frame.index)]
+    columns.extend(frame[name].to_numpy(dtype=dtype).tolist() for name, dtype in _CANDLE_COLUMNS)
+    return (dict(zip(_CANDLE_KEYS, row)) for row in zip(*columns))
+
+
+def _format_dates(index) -> List[str]:
+    """Format a ``DatetimeIndex`` as YYYY-MM-DD strings in one NumPy cast.
+
+    Intraday indexes are timezone-aware; they are converted to naive wall-clock
+    time first so that each candle keeps its exchange-local date.
+    """
+
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype("datetime64[D]").astype(str).tolist()
+
+
+# Number of candles encoded into each chunk of a streamed response.
+_STREAM_CHUNK_SIZE = 512
+
+
+def _stream_historical(symbol: str, interval: str, candles: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """Encode a historical data response incrementally.
+
+    The body is the same JSON document the endpoint has always returned, but
+    it is produced in chunks so that neither the full list of candles nor the
+    full JSON string has to be held in memory.
+    """
+
+    yield b'{"symbol":' + orjson.dumps(symbol) + b',"interval":' + orjson.dumps(interval) + b',"data":['
+    chunk: List[bytes] = []
+    separator = b""
+    for candle in candles:
+        chunk.append(orjson.dumps(candle))
+        if len(chunk) == _STREAM_CHUNK_SIZE:
+            yield separator + b",".join(chunk)
+            separator = b","
+            chunk.clear()
+    if chunk:
+        yield separator + b",".join(chunk)
+    yield b"]}"
+
+
+def _fetch_quote(symbol: str) -> Dict[str, Any]:
+    """Fetch the quote fields exposed by the stock data endpoint.
+
+    ``fast_info`` is evaluated lazily by yfinance, so the fields are read here
+    to keep every upstream call inside the fetch callback.  An empty dict is
+    returned when Yahoo has no data for any of the fields.
+    """
+
+    fast_info = yf.Ticker(symbol, session=_SESSION).fast_info
+    quote = {
+        "currency": fast_info.get("currency"),
+        "last_price": fast_info.get("last_price"),
+        "previous_close": fast_info.get("previous_close"),
+        "open": fast_info.get("open"),
+        "day_high": fast_info.get("day_high"),
+        "day_low": fast_info.get("day_low"),
+        "volume": fast_info.get("volume"),
+        "market_cap": fast_info.get("market_cap"),
+        "fifty_two_week_high": fast_info.get("year_high"),
+        "fifty_two_week_low": fast_info.get("year_low"),
+    }
+    if all(value is None for value in quote.values()):
+        return {}
+    return quote
 
-    first = series.iloc[0]
-    last = series.iloc[-1]
-    return (last - first) / first if first else 0.0
+
+_SPARK_URL = "https://query1.finance.yahoo.com/v8/finance/spark"
+_SPARK_BATCH_SIZE = 20
+
+
+def _fetch_spark(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch one batch of symbols from the spark endpoint, keyed by symbol."""
+
+    response = _SESSION.get(
+        _SPARK_URL,
+        params={"symbols": ",".join(symbols), "range": "1d", "interval": "5m"},
+        timeout=10,
+    )
+    response.raise_for_status()
+    body = response.json()
+
+    # v8 returns one object per symbol; the older layout nests them under
+    # ``spark.result`` with a chart-style ``response`` list.
+    if "spark" in body:
+        entries = {}
+        for result in body["spark"].get("result") or []:
+            chart = (result.get("response") or [{}])[0]
+            meta = chart.get("meta", {})
+            entries[result.get("symbol")] = {
+                "timestamp": chart.get("timestamp"),
+                "close": (chart.get("indicators", {}).get("quote") or [{}])[0].get("close"),
+                "previousClose": meta.get("previousClose"),
+                "chartPreviousClose": meta.get("chartPreviousClose"),
+            }
+    else:
+        entries = body
+
+    quotes = {}
+    for symbol, entry in entries.items():
+        if not isinstance(entry, dict):
+            continue
+        timestamps = entry.get("timestamp") or []
+        closes = entry.get("close") or []
+        last_price = next((close for close in reversed(closes) if close is not None), None)
+        quotes[_normalize_symbol(symbol)] = {
+            "last_price": last_price,
+            "previous_close": entry.get("previousClose") or entry.get("chartPreviousClose"),
+            "timestamps": timestamps,
+            "closes": closes,
+        }
+    return quotes
+
+
+def _chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of ``items`` holding at most ``size`` elements."""
+
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _stats_kernel(prices):
+    """Compute mean, max, min, sample std and total return in a single pass.
+
+    The variance uses Welford's update so that long series stay numerically
+    stable without a second pass over the data.
+    """
+
+    count = prices.shape[0]
+    if count == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+
+    mean = 0.0
+    m2 = 0.0
+    highest = prices[0]
+    lowest = prices[0]
+    for i in range(count):
+        value = prices[i]
+        delta = value - mean
+        mean += delta / (i + 1)
+        m2 += delta * (value - mean)
+        if value > highest:
+            highest = value
+        if value < lowest:
+            lowest = value
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    first = prices[0]
+    total_return = (prices[count - 1] - first) / first if first else 0.0
+    return mean, highest, lowest, std, total_return
+
+
+def _stats_numpy(prices: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """NumPy equivalent of :func:`_stats_kernel` used when numba is missing."""
+
+    if not prices.size:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+
+    std = prices.std(ddof=1) if prices.size > 1 else np.nan
+    first = prices[0]
+    total_return = (prices[-1] - first) / first if first else 0.0
+    return prices.mean(), prices.max(), prices.min(), std, total_return
+
+
+_close_stats = njit(cache=True)(_stats_kernel) if njit is not None else _stats_numpy
 
 
 def _format_officers(officers: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -270,6 +625,27 @@ def _safe_fetch(callback):
         return None
 
 
+def _cached_fetch(cache: MutableMapping[Hashable, Any], key: Hashable, callback: Callable[[], Any]):
+    """Return a cached upstream value, fetching it through ``_safe_fetch`` on a miss.
+
+    Failed or empty fetches are not cached so that the next request retries.
+    """
+
+    # A single ``get`` keeps the lookup atomic: a separate membership test and
+    # read can race with TTL expiry.  Only truthy values are stored, so ``None``
+    # always means a miss.
+    with _CACHE_LOCK:
+        value = cache.get(key)
+    if value is not None:
+        return value
+
+    value = _safe_fetch(callback)
+    if value:
+        with _CACHE_LOCK:
+            cache[key] = value
+    return value
+
+
 def _upstream_error_response():
     """Return a consistent response when upstream data fetch fails."""
 
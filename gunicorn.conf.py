@@ -0,0 +1,17 @@
+"""Gunicorn settings for serving the market data API in production.
+
+Gunicorn loads this file automatically when started from the repository root:
+
+    gunicorn app:app
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Requests spend most of their time waiting on Yahoo Finance, so each worker
+# process runs a pool of threads that overlap those waits.
+worker_class = "gthread"
+workers = int(os.environ.get("GUNICORN_WORKERS", min(4, multiprocessing.cpu_count())))
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 60))